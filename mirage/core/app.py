@@ -1,8 +1,7 @@
-import os
+import os,sys
 from string import Template
-from mirage.core import interpreter,loader,taskManager,module,config,templates
-from mirage.core.module import WirelessModule
-from mirage.libs import io,utils,wireless
+from mirage.core import interpreter,config
+from mirage.libs import io,utils
 
 class App(interpreter.Interpreter):
 	'''
@@ -55,25 +54,51 @@ class App(interpreter.Interpreter):
 		self.tempDir = tempDir
 		self.homeDir = homeDir
 		self.config = config.Config(homeDir + "/mirage.cfg")
-		self.loader = loader.Loader()
+		self._loader = None
 		self.loadedShortcuts = self.config.getShortcuts()
 		self.modules = []
-		self.taskManager = taskManager.TaskManager()
+		self.modulesByName = {}
+		self._taskManager = None
+		self.autocompleteModulesCache = None
+		self.autocompleteParametersCache = None
 		# Creation of the temporary directory
-		if not os.path.exists(self.tempDir):
-			os.mkdir(self.tempDir)
+		os.makedirs(self.tempDir,exist_ok=True)
 
 
 
+	@property
+	def loader(self):
+		'''
+		This property returns the modules loader (``core.loader.Loader``).
+		It is instantiated when it is used for the first time, in order to avoid listing the modules if not needed.
+		'''
+		if self._loader is None:
+			from mirage.core import loader
+			self._loader = loader.Loader()
+		return self._loader
+
+	@property
+	def taskManager(self):
+		'''
+		This property returns the background tasks manager (``core.taskManager.TaskManager``).
+		It is instantiated when it is used for the first time.
+		'''
+		if self._taskManager is None:
+			from mirage.core import taskManager
+			self._taskManager = taskManager.TaskManager()
+		return self._taskManager
+
 	def exit(self):
 		'''
 		This method allows to exit the framework.
 		'''
-		self.taskManager.stopAllTasks()
+		from mirage.core.module import WirelessModule
+		if self._taskManager is not None:
+			self._taskManager.stopAllTasks()
 
-		for emitter in module.WirelessModule.Emitters.values():
+		for emitter in WirelessModule.Emitters.values():
 			emitter.stop()
-		for receiver in module.WirelessModule.Receivers.values():
+		for receiver in WirelessModule.Receivers.values():
 			receiver.stop()
 
 		utils.stopAllSubprocesses()
@@ -120,6 +145,7 @@ class App(interpreter.Interpreter):
 		'''
 		This method allows to interact with the user in order to easily generate an user scenario.
 		'''
+		from mirage.core import templates
 		name = ""
 		while name == "":
 			name = io.ask("Scenario's name")
@@ -139,6 +165,7 @@ class App(interpreter.Interpreter):
 		'''
 		This method allows to interact with the user in order to easily generate an user module.
 		'''
+		from mirage.core import templates
 		name = ""
 		while name == "":
 			name = io.ask("Module's name")
@@ -191,8 +218,13 @@ class App(interpreter.Interpreter):
 	def clear(self):
 		'''
 		This method allows to clear the screen.
+		If the standard output is a terminal, the ANSI escape sequence is directly written instead of spawning ``clear``.
 		'''
-		os.system("clear")
+		if sys.stdout.isatty():
+			sys.stdout.write("\x1b[H\x1b[2J")
+			sys.stdout.flush()
+		else:
+			os.system("clear")
 
 	def list(self, pattern=""):
 		'''
@@ -207,18 +239,17 @@ class App(interpreter.Interpreter):
 	def shortcuts(self,pattern=""):
 		'''
 		This method allows to list the different shortcuts available in the framework. A string pattern can be provided
-		as a filter.
+		as a filter (case insensitive).
 
 		:param pattern: Filter
 		:type pattern: str
 		'''
-		shortcuts = []
-		for shortcutName,shortcut in self.loadedShortcuts.items():
-			if (pattern == "" or
-			    pattern in shortcutName or
-			    pattern in shortcut["description"] or
-			    pattern in shortcut["modules"]):
-				shortcuts.append([shortcutName,shortcut["modules"],shortcut["description"]])
+		pattern = pattern.lower()
+		if pattern == "":
+			matches = self.loadedShortcuts.items()
+		else:
+			matches = [(shortcutName,shortcut) for shortcutName,shortcut in self.loadedShortcuts.items() if pattern in shortcut["search"]]
+		shortcuts = [[shortcutName,shortcut["modules"],shortcut["description"]] for shortcutName,shortcut in matches]
 		if shortcuts != []:
 			io.chart(["Name","Modules","Description"],shortcuts,"Shortcuts")
 		else:
@@ -227,8 +258,11 @@ class App(interpreter.Interpreter):
 	def _autocompleteModules(self):
 		'''
 		This method generates the list of available modules in order to autocomplete "load" command.
+		The list is cached, as the available modules and shortcuts don't change during the execution.
 		'''
-		return self.loader.getModulesNames() + list(self.loadedShortcuts.keys())
+		if self.autocompleteModulesCache is None:
+			self.autocompleteModulesCache = self.loader.getModulesNames() + list(self.loadedShortcuts.keys())
+		return self.autocompleteModulesCache
 
 	def load(self,moduleName:"!method:_autocompleteModules"):
 		'''
@@ -255,24 +289,26 @@ class App(interpreter.Interpreter):
 				tmpModules.append({"name":m+str(counter) if len(modules) > 1 else m,"module":output})
 				counter+=1
 
-				for argument in output.args:
-					if self.config.dataExists(m,argument):
-						output.args[argument] = self.config.getData(m,argument)
+				moduleDatas = self.config.datas.get(m)
+				if moduleDatas:
+					for argument in output.args.keys() & moduleDatas.keys():
+						output.args[argument] = moduleDatas[argument]
 
 			elif m in self.loadedShortcuts:
 				io.info("Shortcut "+m+" loaded !")
 				shortcutModules = []
 				shortcutClasses = []
 				shortcutCounter = 1
-				shortcutModulesList = self.loadedShortcuts[m]["modules"].split("|")
+				shortcut = self.loadedShortcuts[m]
+				shortcutModulesList = shortcut["modulesList"]
+				mappingItems = shortcut["mappingItems"]
 				for n in shortcutModulesList:
 					output = self.loader.load(n)
 					shortcutModules.append({
 						"name":n+str(shortcutCounter) if len(shortcutModulesList) > 1 else n,
 						"module":output
 					})
-					for argument in self.loadedShortcuts[m]["mapping"]:
-						mapping = self.loadedShortcuts[m]["mapping"][argument]
+					for argument,mapping in mappingItems:
 						if mapping["value"] is not None:
 							self._set(argument,mapping["value"],[shortcutModules[-1]])
 
@@ -281,7 +317,7 @@ class App(interpreter.Interpreter):
 				tmpModules.append({
 						"name":m+str(counter) if len(modules) > 1 else m,
 						"shortcut":shortcutModules,
-						"mapping":self.loadedShortcuts[m]["mapping"]
+						"mapping":shortcut["mapping"]
 						})
 				counter+=1
 			else:
@@ -290,19 +326,30 @@ class App(interpreter.Interpreter):
 				break
 		if noError:
 			self.modules = tmpModules
+			self.modulesByName = {m["name"]:m for m in tmpModules}
+			self.autocompleteParametersCache = None
 			self.prompt = io.colorize(" << "+moduleName+" >>~~> ","cyan")
 
 	def _autocompleteParameters(self):
 		'''
 		This method generates a list including the available parameters names in order to autocomplete "set" command.
+		The list is cached until the loaded modules or their parameters are modified.
+		'''
+		if self.autocompleteParametersCache is None:
+			self.autocompleteParametersCache = self._generateParametersList()
+		return self.autocompleteParametersCache
+
+	def _generateParametersList(self):
+		'''
+		This method generates the list of the parameters' names of the loaded modules.
 		'''
 		if len(self.modules) == 0:
 			return []
 		elif len(self.modules) == 1:
 			if "module" in self.modules[0]:
-				return self.modules[0]["module"].args.keys()
+				return list(self.modules[0]["module"].args.keys())
 			elif "shortcut" in self.modules[0]:
-				return self.modules[0]["mapping"].keys()
+				return list(self.modules[0]["mapping"].keys())
 		else:
 			parameters = []
 			for module in self.modules:
@@ -313,59 +360,58 @@ class App(interpreter.Interpreter):
 			return parameters
 
 
+	def _getModuleByName(self,moduleName,modulesList):
+		'''
+		This method returns the module (or shortcut) named ``moduleName`` in the provided list of modules.
+		The loaded modules are indexed by name, the lists of modules used by shortcuts are scanned.
+		'''
+		if modulesList is self.modules:
+			return self.modulesByName.get(moduleName)
+		for module in modulesList:
+			if module["name"] == moduleName and ("shortcut" in module or module.get("module") is not None):
+				return module
+		return None
+
+	def _setOne(self,module,name,value):
+		'''
+		This method provides a value for a specific input parameter of a given module (or shortcut).
+		'''
+		if "module" in module and module["module"] is not None:
+			if module["module"].dynamicArgs or name in module["module"].args:
+				module["module"].args[name] = value
+				return True
+			from mirage.core.module import WirelessModule
+			from mirage.libs import wireless
+			if (name in wireless.SDRDevice.SDR_PARAMETERS and
+			isinstance(module["module"],WirelessModule)):
+				module["module"].sdrConfig[name] = value
+				return True
+			raise self.IncorrectParameter()
+		elif "shortcut" in module:
+			if name not in module["mapping"]:
+				raise self.IncorrectParameter()
+			shortcutMapping = module["mapping"][name]
+			for parametersName in shortcutMapping["parameters"]:
+				if not self._set(parametersName,value,module["shortcut"]):
+					return False
+			shortcutMapping["value"] = value
+			return True
+		else:
+			return False
+
 	def _set(self,name,value,modulesList):
 		if len(modulesList) == 0:
 			raise self.NoModuleLoaded()
-			return False
 		elif len(modulesList) == 1:
-			module = modulesList[0]
-			if "module" in module and module["module"] is not None:
-				if module["module"].dynamicArgs or name in module["module"].args:
-					module["module"].args[name] = value
-					return True
-				elif (name in wireless.SDRDevice.SDR_PARAMETERS.keys() and
-				isinstance(module["module"],WirelessModule)):
-					module["module"].sdrConfig[name] = value
-					return True
-				else:
-					raise self.IncorrectParameter()
-			elif "shortcut" in module:
-				if name in module["mapping"]:
-					shortcutMapping = module["mapping"][name]
-					success = True
-					for parametersName in shortcutMapping["parameters"]:
-						success = success and self._set(parametersName,value,module["shortcut"])
-					if (success):
-						shortcutMapping["value"] = value
-
-					return success
-				else:
-					raise self.IncorrectParameter()
-					return False
-			else:
+			return self._setOne(modulesList[0],name,value)
+		elif "." in name:
+			(moduleName,argName) = name.split(".")
+			module = self._getModuleByName(moduleName,modulesList)
+			if module is None:
 				return False
+			return self._setOne(module,argName,value)
 		else:
-			if "." in name:
-				(moduleName,argName) = name.split(".")
-				for module in modulesList:
-					if "module" in module and module["module"] is not None and moduleName == module["name"]:
-						return self._set(argName,value,[module])
-					elif "shortcut" in module and moduleName == module["name"]:
-						if argName in module["mapping"]:
-							shortcutMapping = module["mapping"][argName]
-							success = True
-							for parametersName in shortcutMapping["parameters"]:
-								success = success and self._set(parametersName,value,module["shortcut"])
-							if (success):
-								shortcutMapping["value"] = value
-							return success
-						else:
-							raise self.IncorrectParameter()
-							return False
-
-			else:
-				raise self.MultipleModulesLoaded()
-				return False
+			raise self.MultipleModulesLoaded()
 
 	def set(self,name:"!method:_autocompleteParameters",value):
 		'''
@@ -382,6 +428,7 @@ class App(interpreter.Interpreter):
 		>>> app.set("ble_connect1.INTERFACE", "hci0")
 
 		'''
+		self.autocompleteParametersCache = None
 		try:
 			self._set(name,value,self.modules)
 		except self.NoModuleLoaded:
@@ -398,21 +445,15 @@ class App(interpreter.Interpreter):
 		This method displays a chart describing the available input parameters for the loaded module.
 		'''
 		for module in self.modules:
-			currentArgs = []
+			prefix = (module["name"]+".") if len(self.modules)>1 else ""
 			if "shortcut" not in module:
-				for argument in module["module"].args:
-					argName = (module["name"]+"."+argument) if len(self.modules)>1 else argument
-					argValue = module["module"].args[argument]
-					currentArgs.append([argName, argValue])
+				currentArgs = [[prefix+argName, argValue] for argName,argValue in module["module"].args.items()]
 				io.chart(["Name","Value"],currentArgs,io.colorize(module["name"],"yellow"))
 			else:
-				for argument in module["mapping"]:
-					argName = (module["name"]+"."+argument) if len(self.modules)>1 else argument
-					if module["mapping"][argument]["value"] is not None:
-						argValue =  module["mapping"][argument]["value"]
-					else:
-						argValue = "<auto>"
-					currentArgs.append([argName, argValue])
+				currentArgs = [
+					[prefix+argName, mapping["value"] if mapping["value"] is not None else "<auto>"]
+					for argName,mapping in module["mapping"].items()
+				]
 				io.chart(["Name", "Value"], currentArgs,io.colorize(module["name"],"green"))
 
 	def args(self):
@@ -436,16 +477,30 @@ class App(interpreter.Interpreter):
 				modules = self.loadedShortcuts[name]["modules"]
 				io.chart(["Name","Modules","Description"],[[name,modules,description]],module["name"]+" (shortcut)")
 
+	def _propagateOutputs(self,args,module):
+		'''
+		This method provides the outputs of the previously executed modules to the input parameters of ``module``.
+		If the module accepts dynamic arguments, every output is provided, otherwise only the matching parameters are updated.
+
+		:param args: dictionary of outputs generated by the previous modules
+		:type args: dict
+		:param module: module to update
+		:type module: core.module.Module
+		'''
+		if module.dynamicArgs:
+			module.args.update(args)
+		else:
+			module.args.update({arg:args[arg] for arg in args.keys() & module.args.keys()})
+
 	def run(self):
 		'''
 		This method runs the loaded module with the input parameters provided.
 		'''
+		self.autocompleteParametersCache = None
 		args = {}
 		for module in self.modules:
 			if "module" in module and module["module"] is not None:
-				for arg in args:
-					if arg in module["module"].args or module["module"].dynamicArgs:
-						module["module"].args[arg] = args[arg]
+				self._propagateOutputs(args,module["module"])
 				output = module["module"].execute()
 				if not output["success"]:
 					io.fail("Execution of module "+module["name"]+" failed !")
@@ -454,9 +509,7 @@ class App(interpreter.Interpreter):
 					args.update(output["output"])
 			elif "shortcut" in module:
 				for shortcutModule in module["shortcut"]:
-					for arg in args:
-						if arg in shortcutModule["module"].args or shortcutModule["module"].dynamicArgs:
-							shortcutModule["module"].args[arg] = args[arg]
+					self._propagateOutputs(args,shortcutModule["module"])
 					output = shortcutModule["module"].execute()
 					if not output["success"]:
 						io.fail("Execution of shortcut "+module["name"]+" failed !")
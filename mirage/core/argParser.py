@@ -15,46 +15,38 @@ class ArgParser:
 		self.appInstance = appInstance
 
 
-	def debug(self):
-		'''
-		This method checks if the debug parameter has been provided by the user on the command line.
-		It will modify the attribute ``debugMode`` stored in the provided instance of core.app.App.
-		'''
-		if "--debug" in sys.argv:
-			self.appInstance.debugMode = True
-			sys.argv.remove("--debug")
-
-
-	def quiet(self):
-		'''
-		This method checks if the quiet parameter has been provided by the user on the command line.
-		It will modify the attribute ``quiet`` stored in the provided instance of core.app.App.
-		'''
-		if "--quiet" in sys.argv:
-			self.appInstance.quiet = True
-			sys.argv.remove("--quiet")
-
-	def verbosity(self):
-		'''
-		This method checks if the verbosity parameter has been provided by the user on the command line.
-		It will modify the variable ``VERBOSITY_LEVEL`` stored in libs.io.
-		'''
-		verbosity = [arg for arg in sys.argv if "--verbosity=" in arg]
-		if len(verbosity) > 0:
-			(_,value) = verbosity[-1].split("--verbosity=")
-			if value.upper() == "NONE" or value == "0":
-				io.VERBOSITY_LEVEL = io.VerbosityLevels.NONE
-			elif value.upper() == "NO_INFO_AND_WARNING" or value == "1":
-				io.VERBOSITY_LEVEL = io.VerbosityLevels.NO_INFO_AND_WARNING
-			elif value.upper() == "NO_INFO" or value=="2":
-				io.VERBOSITY_LEVEL = io.VerbosityLevels.NO_INFO
+	def _parseFlags(self):
+		'''
+		This method checks if the debug, quiet and verbosity parameters have been provided by the user on the command line.
+		It walks the command line once and removes these parameters from ``sys.argv``.
+
+		  - ``--debug`` modifies the attribute ``debugMode`` stored in the provided instance of core.app.App
+		  - ``--quiet`` modifies the attribute ``quiet`` stored in the provided instance of core.app.App
+		  - ``--verbosity=<level>`` modifies the variable ``VERBOSITY_LEVEL`` stored in libs.io
+		'''
+		newArgv = [sys.argv[0]]
+		verbosity = None
+		for arg in sys.argv[1:]:
+			if arg == "--debug":
+				self.appInstance.debugMode = True
+			elif arg == "--quiet":
+				self.appInstance.quiet = True
+			elif arg.startswith("--verbosity="):
+				verbosity = arg.split("=",1)[1]
 			else:
-				io.VERBOSITY_LEVEL = io.VerbosityLevels.ALL
-
-		for arg in sys.argv:
-			if "--verbosity=" in arg:
-				sys.argv.remove(arg)
-
+				newArgv.append(arg)
+		sys.argv[:] = newArgv
+
+		if verbosity is not None:
+			levels = {
+				"NONE":io.VerbosityLevels.NONE,
+				"0":io.VerbosityLevels.NONE,
+				"NO_INFO_AND_WARNING":io.VerbosityLevels.NO_INFO_AND_WARNING,
+				"1":io.VerbosityLevels.NO_INFO_AND_WARNING,
+				"NO_INFO":io.VerbosityLevels.NO_INFO,
+				"2":io.VerbosityLevels.NO_INFO
+			}
+			io.VERBOSITY_LEVEL = levels.get(verbosity.upper(),io.VerbosityLevels.ALL)
 
 	def create_module(self):
 		'''
@@ -129,9 +121,7 @@ class ArgParser:
 		- If a Mirage module has been provided by the user, it calls the method ``launcher`` of core.argParser.ArgParser.
 		
 		'''	
-		self.debug()	
-		self.quiet()
-		self.verbosity()
+		self._parseFlags()
 		if self.create_module() or self.create_scenario():
 			self.appInstance.exit()		
 		elif not self.list():
@@ -1,4 +1,11 @@
-import configparser
+import configparser,os,pickle,re
+from mirage.libs import io,utils
+
+# Version of the cache format, it must be incremented if the structure of datas or shortcuts is modified
+CACHE_VERSION = 2
+
+# Shortcut's argument with a default value, e.g. "INTERFACE,ble_sniff1.INTERFACE(hci0)"
+_ARGUMENT_REGEX = re.compile(r"([^(]*)\(([^)]*)\)")
 
 class Config:
 	'''
@@ -7,67 +14,145 @@ class Config:
 	def __init__(self, filename):
 		'''
 		This constructor initializes the parser and load the configuration file provided in parameter ``filename``.
+		If the cache generated by a previous parsing is up to date, the parser is not instantiated.
 
 		:param filename: Filename of the configuration file
 		:type filename: str
 		'''
-		self.parser = configparser.ConfigParser()
+		self.parser = None
 		self.datas = {}
 		self.shortcuts = {}
 		self.filename = filename
-		self.generateDatas()
-		self.generateShortcuts()
+		self.cacheFilename = filename + ".cache.pkl"
+		self.parsed = False
+		self._parseAll()
 
-	def generateDatas(self):
+	def _parseAll(self):
 		'''
-		This method parses the configuration file and store the corresponding arguments in the attribute ``datas``.
+		This method parses the configuration file once, and stores the module's arguments in the attribute ``datas``
+		and the shortcuts in the attribute ``shortcuts``.
 		'''
+		if self.parsed:
+			return
+		self.parsed = True
+		try:
+			mtime = os.stat(self.filename).st_mtime
+		except OSError:
+			mtime = None
+		if mtime is not None and self._loadCache(mtime):
+			return
+		self.parser = configparser.ConfigParser()
 		try:
 			self.parser.read(self.filename)
-			for module in self.parser.sections():
-				if "shortcut:" not in module:
-					arguments = {}
-					for (key,value) in self.parser.items(module):
-						arguments[key.upper()] = value
-					self.datas[module] = arguments
+			for section in self.parser.sections():
+				if "shortcut:" in section:
+					self._parseShortcut(section)
+				else:
+					self._parseData(section)
 		except configparser.ParsingError:
 			io.fail("Bad format file !")
+			return
+		if mtime is not None:
+			self._saveCache(mtime)
 
-	def generateShortcuts(self):
+	def _loadCache(self,mtime):
 		'''
-		This method parses the configuration file and store the corresponding arguments in the attribute ``datas``.
+		This method loads the datas and shortcuts from the cache file, if it has been generated from the current
+		version of the configuration file.
+
+		:param mtime: modification time of the configuration file
+		:type mtime: float
+		:return: boolean indicating if the cache has been loaded
+		:rtype: bool
 		'''
 		try:
-			self.parser.read(self.filename)
-			for section in self.parser.sections():
-				if "shortcut:" in section:
-					shortcutName = section.split("shortcut:")[1]
-					modules = None
-					description = ""
-					arguments = {}
-					for (key,value) in self.parser.items(section):
-						if key.upper() == "MODULES":
-							modules = value
-						elif key.upper() == "DESCRIPTION":
-							description = value
-						else:
-							if "(" in value and ")" in value:
-								names = value.split("(")[0]
-								defaultValue = value.split("(")[1].split(")")[0]
-
-								arguments[key.upper()] = {
-											"parameters":names.split(","),
-											"value":defaultValue
-								}
-							else:
-								arguments[key.upper()] = {
-											"parameters":value.split(","),
-											"value":None
-								}
-					if modules is not None:
-						self.shortcuts[shortcutName] = {"modules":modules,"description":description,"mapping":arguments}
-		except configparser.ParsingError:
-			io.fail("Bad format file !")
+			with open(self.cacheFilename,"rb") as f:
+				(cacheVersion,cacheMtime,datas,shortcuts) = pickle.load(f)
+		except Exception:
+			return False
+		if cacheVersion != CACHE_VERSION or cacheMtime != mtime:
+			return False
+		self.datas = datas
+		self.shortcuts = shortcuts
+		return True
+
+	def _saveCache(self,mtime):
+		'''
+		This method stores the parsed datas and shortcuts in the cache file (see ``libs.utils.atomicWrite``).
+
+		:param mtime: modification time of the configuration file
+		:type mtime: float
+		'''
+		try:
+			utils.atomicWrite(self.cacheFilename,pickle.dumps((CACHE_VERSION,mtime,self.datas,self.shortcuts)))
+		except OSError:
+			pass
+
+	def _parseData(self,module):
+		'''
+		This method stores the arguments of the section ``module`` in the attribute ``datas``.
+
+		:param module: name of the section (module's name)
+		:type module: str
+		'''
+		arguments = {}
+		for (key,value) in self.parser.items(module):
+			arguments[key.upper()] = value
+		self.datas[module] = arguments
+
+	def _parseShortcut(self,section):
+		'''
+		This method stores the shortcut described by the section ``section`` in the attribute ``shortcuts``.
+
+		:param section: name of the section (``shortcut:<shortcutName>``)
+		:type section: str
+		'''
+		shortcutName = section.split("shortcut:")[1]
+		items = [(key.upper(),value) for (key,value) in self.parser.items(section)]
+		modules = None
+		description = ""
+		arguments = {}
+		for (key,value) in items:
+			if key == "MODULES":
+				modules = value
+			elif key == "DESCRIPTION":
+				description = value
+			else:
+				match = _ARGUMENT_REGEX.match(value)
+				if match is not None:
+					(names,defaultValue) = match.groups()
+					arguments[key] = {
+								"parameters":names.split(","),
+								"value":defaultValue
+					}
+				else:
+					arguments[key] = {
+								"parameters":value.split(","),
+								"value":None
+					}
+		if modules is not None:
+			self.shortcuts[shortcutName] = {
+							"modules":modules,
+							"description":description,
+							"mapping":arguments,
+							"modulesList":modules.split("|"),
+							"mappingItems":list(arguments.items()),
+							"search":(shortcutName+"\0"+description+"\0"+modules).lower()
+			}
+
+	def generateDatas(self):
+		'''
+		This method parses the configuration file and store the corresponding arguments in the attribute ``datas``.
+		The file is only parsed once (see ``_parseAll``).
+		'''
+		self._parseAll()
+
+	def generateShortcuts(self):
+		'''
+		This method parses the configuration file and store the corresponding shortcuts in the attribute ``shortcuts``.
+		The file is only parsed once (see ``_parseAll``).
+		'''
+		self._parseAll()
 
 	def getShortcuts(self):
 		'''
@@ -1,7 +1,6 @@
 from mirage.libs import io
 import readline,shlex,re,inspect,glob,sys
 import os
-import keyboard
 
 class Interpreter:
 	'''
@@ -333,6 +332,7 @@ class Interpreter:
 		'''
 		This method enables the suggestion mode.
 		'''
+		import keyboard
 		keyboard.on_release(self._updateInput)
 		keyboard.on_press_key("enter",self._clearSuggestion)
 
@@ -340,6 +340,7 @@ class Interpreter:
 		'''
 		This method disables the suggestion mode.
 		'''
+		import keyboard
 		keyboard.unhook_all()
 
 	def loop(self):
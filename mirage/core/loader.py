@@ -1,4 +1,17 @@
-from mirage.libs import io
+from mirage.libs import io,utils
+import os,json,functools
+
+@functools.lru_cache(maxsize=None)
+def _infoFor(moduleClass):
+	'''
+	This function returns the informations of a module class, instantiating it only once per process.
+
+	:param moduleClass: class of a module
+	:type moduleClass: core.module.Module
+	:return: dictionary of informations (see ``core.module.Module.info``)
+	:rtype: dict
+	'''
+	return moduleClass().info()
 
 class Loader:
 	'''
@@ -7,13 +20,15 @@ class Loader:
 	def __init__(self):
 		'''
 		This constructor generates the modules list.
+		The modules are not imported at this step : they are imported when they are loaded for the first time.
 		'''
 		import mirage.modules as modules
 		self.modulesList = {}
-		for moduleName,module in modules.__modules__.items():
-			current = module#__import__("modules."+module, fromlist=module)
-			moduleClass = getattr(current,moduleName)
-			self.modulesList[moduleName] = moduleClass
+		self.classCache = {}
+		self.modulesInfos = None
+		for moduleName,modulePath in modules.__modules__.items():
+			self.modulesList[moduleName] = modulePath
+		self.infoCacheFilename = utils.getHomeDir() + "/modules_info.json"
 
 	def getModulesNames(self):
 		'''
@@ -24,6 +39,21 @@ class Loader:
 		'''
 		return list(self.modulesList.keys())
 
+	def getModuleClass(self,moduleName):
+		'''
+		This method returns the class of a specific module according to the name provided as parameter.
+		The corresponding file is imported the first time the module is requested, then the class is cached.
+
+		:param moduleName: name of a module
+		:type moduleName: str
+		:return: class of the module
+		:rtype: core.module.Module
+		'''
+		if moduleName not in self.classCache:
+			current = utils.importFromPath(moduleName,self.modulesList[moduleName])
+			self.classCache[moduleName] = getattr(current,moduleName)
+		return self.classCache[moduleName]
+
 	def load(self,moduleName):
 		'''
 		This method returns an instance of a specific module according to the name provided as parameter.
@@ -34,10 +64,61 @@ class Loader:
 		:rtype: core.module.Module
 		'''
 		if moduleName in self.modulesList:
-			return self.modulesList[moduleName]()
+			return self.getModuleClass(moduleName)()
 		else:
 			return None
 
+	def _loadInfoCache(self):
+		'''
+		This method loads the modules' informations stored on disk by a previous call to ``list``.
+
+		:return: dictionary of cached informations, indexed by module name
+		:rtype: dict
+		'''
+		try:
+			with open(self.infoCacheFilename,"r") as f:
+				return json.load(f)
+		except (OSError,ValueError):
+			return {}
+
+	def _saveInfoCache(self,infoCache):
+		'''
+		This method stores the modules' informations on disk, allowing to list the modules without importing them.
+
+		:param infoCache: dictionary of informations, indexed by module name
+		:type infoCache: dict
+		'''
+		try:
+			utils.atomicWrite(self.infoCacheFilename,json.dumps(infoCache).encode("utf-8"))
+		except OSError:
+			pass
+
+	def getModulesInfos(self):
+		'''
+		This method returns the informations of every existing module.
+		The informations are cached on disk and only regenerated if the module's file has been modified.
+		They are also kept in memory, so the disk cache is only read once per process.
+
+		:return: dictionary of modules' informations, indexed by module name
+		:rtype: dict
+		'''
+		if self.modulesInfos is not None:
+			return self.modulesInfos
+		infoCache = self._loadInfoCache()
+		infos = {}
+		updated = False
+		for module,modulePath in self.modulesList.items():
+			mtime = os.path.getmtime(modulePath)
+			entry = infoCache.get(module)
+			if entry is None or entry["path"] != modulePath or entry["mtime"] != mtime:
+				entry = {"path":modulePath,"mtime":mtime,"info":_infoFor(self.getModuleClass(module))}
+				updated = True
+			infos[module] = entry["info"]
+			infoCache[module] = entry
+		if updated:
+			self._saveInfoCache(infoCache)
+		self.modulesInfos = infos
+		return infos
 
 	def list(self,pattern=""):
 		'''
@@ -48,8 +129,7 @@ class Loader:
 		'''
 		displayDict = {}
 
-		for module in self.modulesList:
-			info = self.modulesList[module]().info()
+		for info in self.getModulesInfos().values():
 			technology = (info["technology"][:1]).upper() + (info["technology"][1:]).lower()
 			if (
 				pattern in info["description"]	or
@@ -1,24 +1,29 @@
-import keyboard
 from mirage.core.scenario import scenarioSignal
 import mirage.libs.io as io
 import mirage.libs.utils as utils
+import types
 '''
 This submodule defines two main classes of the framework : Module & WirelessModule.
 The modules defined in the framework inherits from these classes in order to
 provide a standard API.
 '''
 
+# Methods linked to a scenario signal, indexed by module class
+_signalMethods = {}
+
 class Module:
 	'''
 	This class defines the standard behaviour of a Mirage Module.
 	Every module must inherit of this class.
 	'''
+	__slots__ = ("scenarioEnabled","scenario","type","technology","description","dependencies","args","dynamicArgs")
 	def __init__(self):
 		'''
 		This constructor is used to initialize the main attributes of a module to their default values.
 		It calls the ``init`` method after the initialization process.
 		'''
 		self.scenarioEnabled = False
+		self.scenario = None
 		self.type = "unknown"
 		self.technology = "generic"
 		self.description = ""
@@ -28,7 +33,7 @@ class Module:
 		self.dynamicArgs = False
 		self.init()
 
-	def out(self,success,output={}):
+	def out(self,success,output=None):
 		'''
 		This method is an helper to format the output of the module as needed by the framework.
 
@@ -41,10 +46,10 @@ class Module:
 		'''
 		return {
 			"success":success,
-			"output":output
+			"output":output if output is not None else {}
 			}
 
-	def ok(self,output={}):
+	def ok(self,output=None):
 		'''
 		This method is an helper to format the output of the module if its execution was successful.
 		It calls the ``out`` method.
@@ -64,7 +69,7 @@ class Module:
 		:return: dictionary composed of the ``success`` boolean (key "success") and an empty dictionary.
 		:rtype: dict
 		'''
-		return self.out(False,{})
+		return self.out(False)
 
 	def init(self):
 		'''
@@ -104,7 +109,9 @@ class Module:
 	def execute(self):
 		'''
 		This method allows launch a module execution by calling the methods ``prerun``, ``run`` and ``postrun``.
+		If no scenario can be loaded during the execution, the scenario signals are bypassed (see ``_bypassSignals``).
 		'''
+		self._bypassSignals(self.scenario is None and self.args.get("SCENARIO","") == "")
 		try:
 			self.prerun()
 			output = self.run()
@@ -116,6 +123,42 @@ class Module:
 		except EOFError:
 			self.postrun()
 			raise EOFError
+
+	def _getSignalMethods(self):
+		'''
+		This method returns the methods of the module linked to a scenario signal (see ``core.scenario.scenarioSignal``).
+
+		:return: dictionary of undecorated functions, indexed by method name
+		:rtype: dict
+		'''
+		cls = type(self)
+		methods = _signalMethods.get(cls)
+		if methods is None:
+			methods = {}
+			for name in dir(cls):
+				attribute = getattr(cls,name,None)
+				if getattr(attribute,"_signal",None) is not None:
+					methods[name] = attribute.__wrapped__
+			_signalMethods[cls] = methods
+		return methods
+
+	def _bypassSignals(self,bypass):
+		'''
+		This method allows to directly call the methods linked to a scenario signal, without checking the scenario.
+		If ``bypass`` is True, the undecorated functions are bound to the instance, otherwise the decorated methods are restored.
+
+		:param bypass: boolean indicating if the signals must be bypassed
+		:type bypass: bool
+		'''
+		if not hasattr(self,"__dict__"):
+			# Instances without dictionary (no subclass) can't override their methods
+			return
+		for name,function in self._getSignalMethods().items():
+			if bypass:
+				setattr(self,name,types.MethodType(function,self))
+			else:
+				self.__dict__.pop(name,None)
+
 	def info(self):
 		'''
 		This method is an helper allowing to generate a dictionary including some useful informations about the module.
@@ -148,6 +191,7 @@ class Module:
 		This method allows to register a callback called if a key is pressed (if a scenario is provided).
 		It allows to provide a simple user interaction in scenarios.
 		'''
+		import keyboard
 		keyboard.on_release(self._keyEvent)
 
 	@scenarioSignal("onKey")
@@ -166,6 +210,7 @@ class Module:
 		This method is the callback triggered if a key is pressed (if a scenario is provided).
 		It calls the ``key`` method and pass a string as argument indicating the name of the pressed key.
 		'''
+		import keyboard
 		keyboard.unhook_all()
 		self.key(key.name)
 		keyboard.on_release(self._keyEvent)
@@ -176,20 +221,19 @@ class Module:
 		It initializes the keyboard related signals and instantiates the selected scenario.
 		'''
 		import mirage.scenarios as scenarios
-		if "SCENARIO" in self.args and self.args["SCENARIO"]!="":
-			try:
-				if self.args["SCENARIO"] not in scenarios.__scenarios__:
-					raise ModuleNotFoundError
-				current = scenarios.__scenarios__[self.args["SCENARIO"]]
-				if hasattr(current,self.args["SCENARIO"]):
-					scenarioClass = getattr(current,self.args["SCENARIO"])
-					self.scenario = scenarioClass(module=self)
-					self.scenarioEnabled = True
-					self.watchKeyboard()
-				return True
-			except ModuleNotFoundError:
-				io.fail("Scenario "+self.args["SCENARIO"]+" not found !")
-				return False
+		name = self.args.get("SCENARIO","")
+		if name == "":
+			return False
+		current = scenarios.__scenarios__.get(name)
+		scenarioClass = getattr(current,name,None) if current is not None else None
+		if scenarioClass is None:
+			io.fail("Scenario "+name+" not found !")
+			return False
+		self._bypassSignals(False)
+		self.scenario = scenarioClass(module=self)
+		self.scenarioEnabled = True
+		self.watchKeyboard()
+		return True
 
 
 class WirelessModule(Module):
@@ -202,6 +246,7 @@ class WirelessModule(Module):
 	ReceiversClass = {}
 	Emitters = {}
 	Receivers = {}
+	__slots__ = ("sdrConfig",)
 
 	def __init__(self):
 		super().__init__()
@@ -245,14 +290,17 @@ class WirelessModule(Module):
 		:rtype: core.wireless.Emitter
 		'''
 		interface = interface if interface != "" else self.args['INTERFACE']
-		if interface not in self.__class__.Emitters:
+		emitters = type(self).Emitters
+		emitter = emitters.get(interface)
+		if emitter is None:
 			try:
-				self.__class__.Emitters[interface] = self.__class__.EmittersClass[self.technology](interface=interface)
+				emitter = type(self).EmittersClass[self.technology](interface=interface)
 			except AttributeError:
 				io.fail("Device not found !")
 				utils.exitMirage()
-		self.__class__.Emitters[interface].updateSDRConfig(self.sdrConfig)
-		return self.__class__.Emitters[interface]
+			emitters[interface] = emitter
+		emitter.updateSDRConfig(self.sdrConfig)
+		return emitter
 
 	def getReceiver(self,interface=""):
 		'''
@@ -264,11 +312,14 @@ class WirelessModule(Module):
 		:rtype: core.wireless.Receiver
 		'''
 		interface = interface if interface != "" else self.args['INTERFACE']
-		if interface not in self.__class__.Receivers:
+		receivers = type(self).Receivers
+		receiver = receivers.get(interface)
+		if receiver is None:
 			try:
-				self.__class__.Receivers[interface] = self.__class__.ReceiversClass[self.technology](interface=interface)
+				receiver = type(self).ReceiversClass[self.technology](interface=interface)
 			except AttributeError:
 				io.fail("Device not found !")
 				utils.exitMirage()
-		self.__class__.Receivers[interface].updateSDRConfig(self.sdrConfig)
-		return self.__class__.Receivers[interface]
+			receivers[interface] = receiver
+		receiver.updateSDRConfig(self.sdrConfig)
+		return receiver
@@ -1,5 +1,4 @@
-import traceback
-from mirage.core import module,app
+import traceback,functools,sys
 from mirage.libs import io
 
 class Scenario:
@@ -7,6 +6,7 @@ class Scenario:
 	This class defines a scenario. A Scenario is a Mirage entity allowing to customize the behaviour of a module without 
 	modifying its code, and can be compared to a list of callbacks called when a specific event (or signal) happens.
 	'''
+	__slots__ = ("name","description","module","args","_handlers")
 	def __init__(self,name="",module=None):
 		'''
 		This constructor allows to define the main attributes of a scenario, especially :
@@ -24,26 +24,47 @@ class Scenario:
 		self.description = "A generic collection of callbacks"
 		self.module = module
 		self.args = module.args
-		
+		self._handlers = {name:getattr(self,name) for name in type(self)._handlersNames}
+
+	def __init_subclass__(cls,**kwargs):
+		'''
+		This method lists the methods of a new scenario class which may be called as signal handlers.
+		'''
+		super().__init_subclass__(**kwargs)
+		cls._handlersNames = _listHandlersNames(cls)
 
 
 	def receiveSignal(self,signal,*args, **kwargs):
 		'''
 		This method is called when a signal is received, and calls the corresponding method in the scenario if it exists.
+		The methods of the scenario are listed when the class is created, and bound when the scenario is instantiated.
 		'''
-		if signal in [i for i in dir(self) if "__" not in i]:
-			try:
-				defaultBehaviour = getattr(self,signal)(*args,**kwargs)
-				return defaultBehaviour
-			except Exception as e:
-				if not hasattr(self,signal):
-					io.fail("Non matching method in scenario "+self.name)
-				else:
-					io.fail("An error occured in scenario "+self.name+" !")
-					if app.App.Instance.debugMode:
-			    			traceback.print_exception(type(e), e, e.__traceback__)
-		else:
+		handler = self._handlers.get(signal)
+		if handler is None:
 			return True
+		try:
+			return handler(*args,**kwargs)
+		except Exception as e:
+			from mirage.core import app # No other choice : circular import
+			io.fail("An error occured in scenario "+self.name+" !")
+			if app.App.Instance.debugMode:
+				traceback.print_exception(type(e), e, e.__traceback__)
+
+def _listHandlersNames(cls):
+	'''
+	This function returns the (interned) names of the methods of a scenario class.
+
+	:param cls: scenario class
+	:type cls: core.scenario.Scenario
+	:return: tuple of methods' names
+	:rtype: tuple of str
+	'''
+	return tuple(
+		sys.intern(name) for name in dir(cls)
+		if "__" not in name and callable(getattr(cls,name,None))
+	)
+
+Scenario._handlersNames = _listHandlersNames(Scenario)
 
 def scenarioSignal(argument):
 	'''
@@ -52,16 +73,18 @@ def scenarioSignal(argument):
 	:param argument: signal name
 	:type argument: str
 	'''
+	argument = sys.intern(argument)
 	def signalDecorator(function):
+		@functools.wraps(function)
 		def wrapper(self,*args, **kwargs):
-			if hasattr(self,"scenario"):
-				defaultBehaviour = self.scenario.receiveSignal(argument,*args,**kwargs)
-			else:
-				defaultBehaviour = True
+			scenario = self.scenario
+			if scenario is None:
+				return function(self,*args,**kwargs)
+			defaultBehaviour = scenario.receiveSignal(argument,*args,**kwargs)
 			if defaultBehaviour is None or defaultBehaviour:
-				result = function(self,*args,**kwargs)
-			else:
-				result = None	
-			return result
+				return function(self,*args,**kwargs)
+			return None
+		# The signal name and the decorated function (__wrapped__) allow modules to bypass the wrapper
+		wrapper._signal = argument
 		return wrapper
 	return signalDecorator
@@ -1,13 +1,19 @@
 from mirage.libs import utils
 import multiprocessing,os,sys
-from ctypes import c_char_p
+
+# States of a task, stored as an integer shared between the main process and the task
+STOPPED = 0
+RUNNING = 1
+ENDED = 2
+_STATES = {STOPPED:"stopped",RUNNING:"running",ENDED:"ended"}
 
 class Task(multiprocessing.Process):
 	'''
 	This class defines a background Task, it inherits from ``multiprocessing.Process``.
 	It provides an user friendly API to easily run a given function in background.
 	'''
-	def __init__(self,function,name,args=[],kwargs={}):
+	__slots__ = ("function","taskName","args","kwargs","state","outputFilename")
+	def __init__(self,function,name,args=None,kwargs=None,state=None):
 		'''
 		This constructor allows to provide the main characteristics of the task, and initializes the attributes.
 		
@@ -19,34 +25,40 @@ class Task(multiprocessing.Process):
 		:type args: list
 		:param kwargs: dictionary of named arguments
 		:type kwargs: dict
+		:param state: shared integer storing the task's state (a new one is allocated if not provided)
+		:type state: multiprocessing.Value
 		'''
 		self.function = function
 		self.taskName = name
-		self.args = args
-		self.kwargs = kwargs
-		self.manager = multiprocessing.Manager()
-		self.state = self.manager.Value(c_char_p, "stopped")
+		self.args = args if args is not None else []
+		self.kwargs = kwargs if kwargs is not None else {}
+		self.state = state if state is not None else multiprocessing.Value('i', STOPPED, lock=False)
 		self.outputFilename = ""
-		self.outputFile = None
 		super().__init__()
 
 	def run(self):
 		'''
 		This method runs the specified function in background.
 		
-		.. note:: The standard output is automatically redirected in a temporary file, named ``<taskName>-<taskPID>.out``
+		.. note:: The standard output and the standard error are automatically redirected (at the file descriptor level,
+		   including the output of native libraries) in a temporary file, named ``<taskName>-<taskPID>.out``
 		'''
 		self.outputFilename = utils.getTempDir()+"/"+self.taskName+"-"+str(os.getpid()) + ".out"
-		self.outputFile = open(self.outputFilename, 'a')
-		sys.stdout = self.outputFile
+		sys.stdout.flush()
+		sys.stderr.flush()
+		fd = os.open(self.outputFilename, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+		os.dup2(fd, 1)
+		os.dup2(fd, 2)
+		os.close(fd)
+		sys.stdout = open(1, "w", buffering=1, closefd=False)
 		self.function(*(self.args), **(self.kwargs))
-		self.state.value = "ended"
+		self.state.value = ENDED
 
 	def start(self):
 		'''
 		This method allows to start the current task.
 		'''
-		self.state.value = "running"
+		self.state.value = RUNNING
 		super().start()
 		self.outputFilename = utils.getTempDir()+"/"+self.taskName+"-"+str(self.pid)+".out"
 
@@ -55,10 +67,18 @@ class Task(multiprocessing.Process):
 		'''
 		This method allows to stop the current task.
 		'''
-		self.state.value = "stopped"
+		self.state.value = STOPPED
 		self.terminate()
-		if self.outputFile is not None:
-			self.outputFile.close()
+
+	@property
+	def stateName(self):
+		'''
+		This property returns the name of the current state of the task ("stopped", "running" or "ended").
+
+		:return: name of the task's state
+		:rtype: str
+		'''
+		return _STATES[self.state.value]
 
 	def toList(self):
 		'''
@@ -73,4 +93,4 @@ class Task(multiprocessing.Process):
 		:return: list representing the current task
 		:rtype: list of str
 		''' 
-		return [str(self.pid), self.taskName, self.state.value, self.outputFilename]
+		return [str(self.pid), self.taskName, self.stateName, self.outputFilename]
@@ -1,6 +1,4 @@
-from .task import Task
-from copy import copy
-import psutil
+from .task import Task,STOPPED,RUNNING
 
 class TaskManager:
 	'''
@@ -9,12 +7,15 @@ class TaskManager:
 	'''
 	def __init__(self):
 		self.tasks = {}
+		# Next suffix to use for each task name
+		self.nameCounters = {}
 
-	def addTask(self, function, name="", args=[],kwargs={}):
+	def addTask(self, function, name="", args=None,kwargs=None):
 		'''
 		This method allows to create a new background task.
 		It instantiates a ``core.task.Task`` and adds it to the task dictionary ``tasks``.
-		If a task already exists using the specified name, it will be suffixed by a number.
+		If a task has already been created using the specified name, it will be suffixed by a number.
+		The suffixes are never reused, even if the corresponding tasks have been stopped.
 		
 		:param function: function to launch in background
 		:type function: function
@@ -28,11 +29,12 @@ class TaskManager:
 		:rtype: str
 		'''
 		baseName = name if name != "" else function.__name__
-		taskName = baseName
-		counter = 1
+		counter = self.nameCounters.get(baseName,0)
+		taskName = baseName if counter == 0 else baseName + "." + str(counter)
 		while taskName in self.tasks:
-			taskName = baseName + "." + str(counter)
 			counter+=1
+			taskName = baseName + "." + str(counter)
+		self.nameCounters[baseName] = counter + 1
 
 		self.tasks[taskName] = Task(function,taskName, args=args, kwargs=kwargs)
 		return taskName
@@ -44,7 +46,7 @@ class TaskManager:
 		:param name: name of the task to start
 		:type name: str
 		'''
-		if name in self.tasks and self.tasks[name].state.value == "stopped":
+		if name in self.tasks and self.tasks[name].state.value == STOPPED:
 			self.tasks[name].start()
 			return True
 		return False
@@ -56,13 +58,22 @@ class TaskManager:
 		:param name: name of the task to stop
 		:type name: str
 		'''
-		if name in self.tasks and self.tasks[name].state.value == "running":
-			for child in psutil.Process(self.tasks[name].pid).children():
+		task = self.tasks.get(name)
+		if task is None or task.state.value != RUNNING:
+			return False
+		import psutil
+		try:
+			children = psutil.Process(task.pid).children(recursive=False)
+		except psutil.NoSuchProcess:
+			children = ()
+		for child in children:
+			try:
 				child.terminate()
-			self.tasks[name].stop()
-			del self.tasks[name]
-			return True
-		return False
+			except psutil.NoSuchProcess:
+				pass
+		task.stop()
+		self.tasks.pop(name, None)
+		return True
 
 	def restartTask(self,name):
 		'''
@@ -73,7 +84,7 @@ class TaskManager:
 		'''
 		task = self.tasks[name]
 		self.stopTask(name)
-		self.tasks[name] = Task(task.function,name, args=task.args, kwargs=task.kwargs)
+		self.tasks[name] = Task(task.function,name, args=task.args, kwargs=task.kwargs, state=task.state)
 		self.tasks[name].start()
 		return True
 
@@ -81,11 +92,11 @@ class TaskManager:
 		'''
 		This method stop all running tasks.
 		'''
-		for task in copy(self.tasks):
-			if self.tasks[task].state.value == "running":
-				self.stopTask(task)
+		for name,task in list(self.tasks.items()):
+			if task.state.value == RUNNING:
+				self.stopTask(name)
 			else:
-				del self.tasks[task]
+				self.tasks.pop(name, None)
 
 	def getTaskPID(self,name):
 		'''
@@ -111,7 +122,7 @@ class TaskManager:
 		:rtype: str
 		'''
 		if name in self.tasks:
-			return self.tasks[name].state.value
+			return self.tasks[name].stateName
 		else:
 			return None
 
@@ -125,5 +136,13 @@ class TaskManager:
 		:rtype: list
 		
 		'''
-		return [t.toList() for t in self.tasks.values() if pattern in t.name or pattern in str(t.pid) or pattern in t.state.value]
+		if pattern == "":
+			return [t.toList() for t in self.tasks.values()]
+		tasksList = []
+		for t in self.tasks.values():
+			pid = str(t.pid)
+			state = t.stateName
+			if pattern in t.taskName or pattern in pid or pattern in state:
+				tasksList.append([pid, t.taskName, state, t.outputFilename])
+		return tasksList
 	
@@ -87,6 +87,14 @@ def colorize(message,color):
 	return "{0}{1}{2}".format(colorCode(color),message,colorCode("default"))
 
 
+# Colored prefixes of the messages, generated once
+_SUCCESS_PREFIX = colorize("[SUCCESS] ","green")
+_FAIL_PREFIX = colorize("[FAIL] ","red")
+_INFO_PREFIX = colorize("[INFO] ","yellow")
+_PACKET_PREFIX = colorize("[PACKET] ","yellow")
+_WARNING_PREFIX = colorize("[WARNING] ","purple")
+
+
 def enterPinCode(message="Enter pin code: ",maxLength = 6):
 	'''
 	This function asks the user to enter a PIN code, and checks if the provided answer is valid.
@@ -119,7 +127,7 @@ def success(message):
 	:type message: str
 	'''
 	if VERBOSITY_LEVEL > VerbosityLevels.NONE:
-		print(colorize("[SUCCESS] ","green")+message)
+		print(_SUCCESS_PREFIX+message)
 
 def fail(message):
 	'''
@@ -129,7 +137,7 @@ def fail(message):
 	:type message: str
 	'''
 	if VERBOSITY_LEVEL > VerbosityLevels.NONE:
-		print(colorize("[FAIL] ","red")+message)
+		print(_FAIL_PREFIX+message)
 
 def info(message):
 	'''
@@ -139,7 +147,7 @@ def info(message):
 	:type message: str
 	'''
 	if VERBOSITY_LEVEL == VerbosityLevels.ALL:
-		print(colorize("[INFO] ","yellow")+message)
+		print(_INFO_PREFIX+message)
 
 
 def displayPacket(packet):
@@ -150,7 +158,7 @@ def displayPacket(packet):
 	:type packet: mirage.libs.wireless_utils.packets.Packet
 	'''
 	if VERBOSITY_LEVEL == VerbosityLevels.ALL:
-		print(colorize("[PACKET] ","yellow")+str(packet))
+		print(_PACKET_PREFIX+str(packet))
 
 
 def warning(message):
@@ -161,7 +169,7 @@ def warning(message):
 	:type message: str
 	'''
 	if VERBOSITY_LEVEL > VerbosityLevels.NO_INFO_AND_WARNING:
-		print(colorize("[WARNING] ","purple")+message)
+		print(_WARNING_PREFIX+message)
 
 
 def ask(prompt,default="",final=": "):
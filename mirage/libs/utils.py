@@ -1,6 +1,24 @@
-import psutil,time,os,sys,string,random,imp
+import psutil,time,os,sys,string,random,imp,importlib.util
 from os.path import expanduser,exists
 
+def importFromPath(name, path):
+	'''
+	This function imports a Python file as a module named ``name``, and registers it in ``sys.modules``.
+	
+	:param name: name of the module
+	:type name: str
+	:param path: path of the Python file
+	:type path: str
+	:return: imported module
+	:rtype: module
+
+	'''
+	spec = importlib.util.spec_from_file_location(name, path)
+	module = importlib.util.module_from_spec(spec)
+	sys.modules[name] = module
+	spec.loader.exec_module(module)
+	return module
+
 def generateModulesDictionary(moduleDir, moduleUserDir):
 	'''
 	This function generates a dictionary of Mirage modules, by including files stored in ``moduleDir`` and ``moduleUserDir``.
@@ -12,20 +30,35 @@ def generateModulesDictionary(moduleDir, moduleUserDir):
 	:return: dictionary of Mirage's modules
 	:rtype: dict of str: module
 
+	'''
+	return {name:importFromPath(name,path) for name,path in generateModulesPaths(moduleDir, moduleUserDir).items()}
+
+
+def generateModulesPaths(moduleDir, moduleUserDir):
+	'''
+	This function generates a dictionary of Mirage modules' paths, by listing files stored in ``moduleDir`` and ``moduleUserDir``.
+	Unlike ``generateModulesDictionary``, the modules are not imported : they can be loaded later, when needed.
+	
+	:param moduleDir: path of Mirage's modules directory
+	:type moduleDir: str
+	:param moduleUserDir: path of Mirage's user modules directory
+	:type moduleUserDir: str
+	:return: dictionary of Mirage's modules' paths
+	:rtype: dict of str: str
+
 	'''
 	modules = {}
 
 	for module in os.listdir(moduleDir):
 		if os.path.isfile(moduleDir+"/"+module) and module[-3:] == ".py" and module != "__init__.py":
-			modules[module[:-3]] = imp.load_source(module[:-3],moduleDir + "/"+module)
+			modules[module[:-3]] = moduleDir + "/"+module
 		
 	for module in os.listdir(moduleUserDir):
 		if os.path.isfile(moduleUserDir+"/"+module) and module[-3:] == ".py" and module != "__init__.py":
-			modules[module[:-3]] = imp.load_source(module[:-3],moduleUserDir + "/"+module)
+			modules[module[:-3]] = moduleUserDir + "/"+module
 
 	return modules
 
-
 def generateScenariosDictionary(scenariosDir, scenariosUserDir):
 	'''
 	This function generates a dictionary of Mirage scenarios, by including files stored in ``scenariosDir`` and ``scenariosUserDir``.
@@ -66,14 +99,8 @@ def initializeHomeDir():
 	:rtype: str
 	'''
 	homeDir = expanduser("~")+"/.mirage"
-	if not exists(homeDir):
-		os.mkdir(homeDir)
-	
-	if not exists(homeDir+"/modules"):
-		os.mkdir(homeDir+"/modules")
-
-	if not exists(homeDir+"/scenarios"):
-		os.mkdir(homeDir+"/scenarios")
+	os.makedirs(homeDir+"/modules",exist_ok=True)
+	os.makedirs(homeDir+"/scenarios",exist_ok=True)
 
 	if not exists(homeDir+"/mirage.cfg"):
 		open(homeDir+"/mirage.cfg", 'a').close()
@@ -110,7 +137,33 @@ def getTempDir():
 	from mirage.core import app # No other choice : circular import
 	return app.App.Instance.tempDir
 
-def addTask(function, name='', args=[],kwargs={}):
+def atomicWrite(filename, content):
+	'''
+	This function writes the provided content in a file, in a single buffered write.
+	The content is written in a temporary file which then replaces the target file, so that a reader never observes
+	a partially written file.
+
+	:param filename: path of the file to write
+	:type filename: str
+	:param content: content to write
+	:type content: bytes
+
+	:Example:
+
+	>>> utils.atomicWrite("/tmp/mirage/output.txt",b"content")
+
+	'''
+	tempFilename = filename+"."+str(os.getpid())+".tmp"
+	try:
+		with open(tempFilename,"wb") as f:
+			f.write(content)
+		os.replace(tempFilename,filename)
+	except OSError:
+		if exists(tempFilename):
+			os.remove(tempFilename)
+		raise
+
+def addTask(function, name='', args=None,kwargs=None):
 	'''
 	This function allows to quickly add a new background task.
 	
@@ -1,6 +1,6 @@
 import os, sys, imp
 from mirage.core.app import App
-from mirage.libs.utils import getHomeDir,generateModulesDictionary
+from mirage.libs.utils import getHomeDir,generateModulesPaths
 
 if App.Instance is not None:
 	# Modules Directory
@@ -10,8 +10,8 @@ if App.Instance is not None:
 	# Insertion of the root directory in the PYTHON PATH
 	#sys.path.insert(0,  os.path.abspath(os.path.dirname(__file__)+"/.."))
 
-	# Creation of the list of modules()
-	__modules__ = generateModulesDictionary(MODULES_DIR, MODULES_USER_DIR)
+	# Creation of the list of modules' paths (modules are imported by the loader when needed)
+	__modules__ = generateModulesPaths(MODULES_DIR, MODULES_USER_DIR)
 '''
 __modules__ = {}
 